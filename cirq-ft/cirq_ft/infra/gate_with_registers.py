@@ -13,17 +13,26 @@
 # limitations under the License.
 
 import abc
+import functools
+import itertools
+import operator
 import sys
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union, overload
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union, cast, overload
 
 import attr
 import cirq
 import numpy as np
+from cirq._compat import cached_property
 
 assert sys.version_info > (3, 6), "https://docs.python.org/3/whatsnew/3.6.html#whatsnew36-pep468"
 
 
-@attr.frozen
+def _intern_name(name: str) -> str:
+    # `sys.intern` only accepts exact `str` instances; leave anything else untouched.
+    return sys.intern(name) if type(name) is str else name
+
+
+@attr.frozen(cache_hash=True)
 class Register:
     """A quantum register used to define the input/output API of a `cirq_ft.GateWithRegister`
 
@@ -32,7 +41,7 @@ class Register:
         bitsize: The number of (qu)bits in the register.
     """
 
-    name: str
+    name: str = attr.field(converter=_intern_name)
     bitsize: int
 
     def __repr__(self):
@@ -47,17 +56,31 @@ class Registers:
     """
 
     def __init__(self, registers: Iterable[Register]):
-        self._registers = tuple(registers)
-        self._register_dict = {r.name: r for r in self._registers}
-        if len(self._registers) != len(self._register_dict):
-            raise ValueError("Please provide unique register names.")
+        self._register_dict: Dict[str, Register] = {}
+        for reg in registers:
+            if reg.name in self._register_dict:
+                raise ValueError(f"Please provide unique register names: {reg.name} is repeated.")
+            self._register_dict[reg.name] = reg
+        self._registers = tuple(self._register_dict.values())
+        self._names = tuple(reg.name for reg in self._registers)
 
     def __repr__(self):
         return f'cirq_ft.Registers({self._registers})'
 
-    @property
+    # The derived state below is computed lazily so that constructing a `Registers`, e.g. when
+    # slicing an existing one, only pays for what is actually used.
+    @cached_property
+    def _offsets(self) -> Tuple[int, ...]:
+        return (0, *itertools.accumulate(reg.bitsize for reg in self._registers))
+
+    @cached_property
+    def _slices(self) -> Tuple[slice, ...]:
+        offsets = self._offsets
+        return tuple(slice(start, end) for start, end in zip(offsets, offsets[1:]))
+
+    @cached_property
     def bitsize(self) -> int:
-        return sum(reg.bitsize for reg in self)
+        return self._offsets[-1]
 
     @classmethod
     def build(cls, **registers: int) -> 'Registers':
@@ -76,12 +99,14 @@ class Registers:
         pass
 
     def __getitem__(self, key):
-        if isinstance(key, slice):
-            return Registers(self._registers[key])
+        # Name lookups are by far the most common, so check for them first and without an
+        # `isinstance` MRO walk.
+        if type(key) is str:
+            return self._register_dict[key]
         elif isinstance(key, int):
             return self._registers[key]
-        elif isinstance(key, str):
-            return self._register_dict[key]
+        elif isinstance(key, slice):
+            return type(self)(self._registers[key])
         else:
             raise IndexError(f"key {key} must be of the type str/int/slice.")
 
@@ -95,34 +120,47 @@ class Registers:
         return len(self._registers)
 
     def split_qubits(self, qubits: Sequence[cirq.Qid]) -> Dict[str, Sequence[cirq.Qid]]:
-        qubit_regs = {}
-        base = 0
-        for reg in self:
-            qubit_regs[reg.name] = qubits[base : base + reg.bitsize]
-            base += reg.bitsize
-        return qubit_regs
+        return {name: qubits[s] for name, s in zip(self._names, self._slices)}
 
     def merge_qubits(self, **qubit_regs: Union[cirq.Qid, Sequence[cirq.Qid]]) -> List[cirq.Qid]:
         ret: List[cirq.Qid] = []
-        for reg in self:
-            assert reg.name in qubit_regs, "All qubit registers must pe present"
-            qubits = qubit_regs[reg.name]
-            qubits = [qubits] if isinstance(qubits, cirq.Qid) else qubits
-            assert (
-                len(qubits) == reg.bitsize
-            ), f"{reg.name} register must of length {reg.bitsize} but is of length {len(qubits)}"
-            ret += qubits
+        for reg in self._registers:
+            qubits = qubit_regs.get(reg.name)
+            if qubits is None:
+                raise ValueError(f"All qubit registers must be present, {reg.name} is missing.")
+            if isinstance(qubits, cirq.Qid):
+                qubits = (qubits,)
+            if len(qubits) != reg.bitsize:
+                raise ValueError(
+                    f"{reg.name} register must be of length {reg.bitsize} "
+                    f"but is of length {len(qubits)}."
+                )
+            ret.extend(qubits)
         return ret
 
-    def get_named_qubits(self) -> Dict[str, List[cirq.Qid]]:
-        def qubits_for_reg(name: str, bitsize: int):
-            return (
-                [cirq.NamedQubit(f"{name}")]
-                if bitsize == 1
-                else cirq.NamedQubit.range(bitsize, prefix=name)
+    @cached_property
+    def _named_qubits(self) -> Dict[str, Tuple[cirq.Qid, ...]]:
+        return {
+            reg.name: (
+                (cirq.NamedQubit(reg.name),)
+                if reg.bitsize == 1
+                else tuple(cirq.NamedQubit.range(reg.bitsize, prefix=reg.name))
             )
+            for reg in self._registers
+        }
 
-        return {reg.name: qubits_for_reg(reg.name, reg.bitsize) for reg in self}
+    def get_named_qubits(self) -> Dict[str, List[cirq.Qid]]:
+        # The qubits are constructed once per `Registers`; callers get fresh lists they may mutate.
+        return {name: list(qubits) for name, qubits in self._named_qubits.items()}
+
+    @cached_property
+    def diagram_wire_symbols(self) -> Tuple[str, ...]:
+        """Register names repeated once per qubit, used as default circuit diagram wire symbols."""
+        return tuple(
+            itertools.chain.from_iterable(
+                itertools.repeat(reg.name, reg.bitsize) for reg in self._registers
+            )
+        )
 
     def __eq__(self, other) -> bool:
         return self._registers == other._registers
@@ -131,7 +169,7 @@ class Registers:
         return hash(self._registers)
 
 
-@attr.frozen
+@attr.frozen(cache_hash=True)
 class SelectionRegister(Register):
     """Register used to represent SELECT register for various LCU methods.
 
@@ -167,9 +205,20 @@ class SelectionRegisters(Registers):
 
     def __init__(self, registers: Iterable[SelectionRegister]):
         super().__init__(registers)
-        self.iteration_lengths = tuple([reg.iteration_length for reg in registers])
-        self._suffix_prod = np.multiply.accumulate(self.iteration_lengths[::-1])[::-1]
-        self._suffix_prod = np.append(self._suffix_prod, [1])
+        selection_regs = cast(Tuple[SelectionRegister, ...], self._registers)
+        self.iteration_lengths = tuple(reg.iteration_length for reg in selection_regs)
+
+    @cached_property
+    def _strides(self) -> Tuple[int, ...]:
+        strides = [1]
+        for iteration_length in reversed(self.iteration_lengths[1:]):
+            strides.append(strides[-1] * int(iteration_length))
+        strides.reverse()
+        return tuple(strides)
+
+    @cached_property
+    def _strides_np(self) -> np.ndarray:
+        return np.asarray(self._strides, dtype=np.int64)
 
     def to_flat_idx(self, *selection_vals: int) -> int:
         """Flattens a composite index represented by a Tuple[int, ...] to a single output integer.
@@ -199,11 +248,54 @@ class SelectionRegisters(Registers):
         https://arxiv.org/abs/1805.03662
         """
         assert len(selection_vals) == len(self)
-        return sum(v * self._suffix_prod[i + 1] for i, v in enumerate(selection_vals))
+        return sum(map(operator.mul, selection_vals, self._strides))
 
-    @property
+    def to_flat_idx_batch(self, selection_vals: np.ndarray) -> np.ndarray:
+        """Vectorized version of `to_flat_idx` for a batch of composite indices.
+
+        Each row of `selection_vals` is a composite index, i.e. `selection_vals` is an integer
+        array of shape `(N, len(self))`. Callers sweeping over the full selection space should
+        prefer this over calling `to_flat_idx` in nested Python loops, for example:
+
+        >>> import cirq_ft
+        >>> import numpy as np
+        >>> regs = cirq_ft.SelectionRegisters.build(x=(2, 3), y=(3, 5))
+        >>> selection_vals = np.indices(regs.iteration_lengths).reshape(len(regs), -1).T
+        >>> print(regs.to_flat_idx_batch(selection_vals))
+        [ 0  1  2  3  4  5  6  7  8  9 10 11 12 13 14]
+        """
+        return np.asarray(selection_vals, dtype=np.int64) @ self._strides_np
+
+    def to_flat_idx_array(self, *selection_vals: np.ndarray) -> np.ndarray:
+        """Flattens composite indices given as one integer array per selection register.
+
+        This is the array counterpart of `to_flat_idx` and delegates to `np.ravel_multi_index`,
+        which uses the same row-major mapping. Use `to_flat_idx` for a single composite index
+        and this method, or `to_flat_idx_batch` when the indices are stacked row-wise, to
+        flatten many indices at once.
+
+        >>> import cirq_ft
+        >>> import numpy as np
+        >>> regs = cirq_ft.SelectionRegisters.build(x=(2, 3), y=(3, 5))
+        >>> print(regs.to_flat_idx_array(np.array([0, 1, 2]), np.array([4, 0, 3])))
+        [ 4  5 13]
+        """
+        return np.ravel_multi_index(selection_vals, dims=self.iteration_lengths, order='C')
+
+    def all_flat_indices(self) -> np.ndarray:
+        """Flat indices of all composite indices, enumerated in row-major (C) order.
+
+        Equivalent to `self.to_flat_idx_batch(selection_vals)` where `selection_vals` enumerates
+        the full Cartesian product of `self.iteration_lengths` in row-major order, but without
+        materializing the `(total_iteration_size, len(self))` matrix of composite indices.
+        Since the strides used by `to_flat_idx` are exactly the row-major strides, this sweep
+        visits every flat index in increasing order.
+        """
+        return np.arange(self.total_iteration_size, dtype=np.int64)
+
+    @cached_property
     def total_iteration_size(self) -> int:
-        return int(np.product(self.iteration_lengths))
+        return functools.reduce(operator.mul, self.iteration_lengths, 1)
 
     @classmethod
     def build(cls, **registers: Union[int, Tuple[int, int]]) -> 'SelectionRegisters':
@@ -230,14 +322,7 @@ class SelectionRegisters(Registers):
         pass
 
     def __getitem__(self, key):
-        if isinstance(key, slice):
-            return SelectionRegisters(self._registers[key])
-        elif isinstance(key, int):
-            return self._registers[key]
-        elif isinstance(key, str):
-            return self._register_dict[key]
-        else:
-            raise IndexError(f"key {key} must be of the type str/int/slice.")
+        return super().__getitem__(key)
 
     def __repr__(self) -> str:
         return f'cirq_ft.SelectionRegisters({self._registers})'
@@ -323,9 +408,6 @@ class GateWithRegisters(cirq.Gate, metaclass=abc.ABCMeta):
 
         Descendants can override this method with more meaningful circuit diagram information.
         """
-        wire_symbols = []
-        for reg in self.registers:
-            wire_symbols += [reg.name] * reg.bitsize
-
+        wire_symbols = list(self.registers.diagram_wire_symbols)
         wire_symbols[0] = self.__class__.__name__
         return cirq.CircuitDiagramInfo(wire_symbols=wire_symbols)
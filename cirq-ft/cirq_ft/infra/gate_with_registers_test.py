@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
+
 import cirq
 import cirq_ft
+import numpy as np
 import pytest
 from cirq_ft.infra.jupyter_tools import execute_notebook
 
@@ -22,6 +25,14 @@ def test_register():
     r = cirq_ft.Register("my_reg", 5)
     assert r.bitsize == 5
 
+    # Register names are interned, except for values `sys.intern` can't handle.
+    assert cirq_ft.Register("".join(["my", "_reg"]), 5).name is sys.intern("my_reg")
+
+    class _Name(str):
+        pass
+
+    assert cirq_ft.Register(_Name("my_reg"), 5).name == "my_reg"
+
 
 def test_registers():
     r1 = cirq_ft.Register("r1", 5)
@@ -57,6 +68,10 @@ def test_registers():
     qubits = qubits[::-1]
     merged_qregs = regs.merge_qubits(r1=qubits[:5], r2=qubits[5:7], r3=qubits[-1])
     assert merged_qregs == qubits
+    with pytest.raises(ValueError, match="must be present"):
+        _ = regs.merge_qubits(r1=qubits[:5], r2=qubits[5:7])
+    with pytest.raises(ValueError, match="must be of length 2"):
+        _ = regs.merge_qubits(r1=qubits[:5], r2=qubits[5:6], r3=qubits[-1])
 
     expected_named_qubits = {
         "r1": cirq.NamedQubit.range(5, prefix="r1"),
@@ -64,6 +79,10 @@ def test_registers():
         "r3": [cirq.NamedQubit("r3")],
     }
     assert regs.get_named_qubits() == expected_named_qubits
+    # Mutating the returned lists must not affect subsequent calls.
+    regs.get_named_qubits()["r1"].pop()
+    assert regs.get_named_qubits() == expected_named_qubits
+    assert regs.diagram_wire_symbols == ("r1",) * 5 + ("r2",) * 2 + ("r3",)
     # Python dictionaries preserve insertion order, which should be same as insertion order of
     # initial registers.
     for reg_order in [[r1, r2, r3], [r2, r3, r1]]:
@@ -81,10 +100,23 @@ def test_selection_registers_indexing(n, N, m, M):
     for x in range(N):
         for y in range(M):
             assert reg.to_flat_idx(x, y) == x * M + y
+    selection_vals = np.indices(reg.iteration_lengths).reshape(len(reg), -1).T
+    np.testing.assert_array_equal(reg.to_flat_idx_batch(selection_vals), np.arange(N * M))
+    np.testing.assert_array_equal(reg.all_flat_indices(), reg.to_flat_idx_batch(selection_vals))
+    np.testing.assert_array_equal(reg.to_flat_idx_array(*selection_vals.T), np.arange(N * M))
+    with pytest.raises(ValueError):
+        _ = reg.to_flat_idx_array(selection_vals[:, 0])
 
     assert reg.total_iteration_size == N * M
 
 
+def test_selection_registers_indexing_3d():
+    reg = cirq_ft.SelectionRegisters.build(x=(2, 3), y=(3, 5), z=(4, 11))
+    flat_indices = [reg.to_flat_idx(x, y, z) for x in range(3) for y in range(5) for z in range(11)]
+    assert flat_indices == list(range(3 * 5 * 11))
+    assert reg.total_iteration_size == 3 * 5 * 11
+
+
 def test_selection_registers_consistent():
     with pytest.raises(ValueError, match="iteration length must be in "):
         _ = cirq_ft.SelectionRegister('a', 3, 10)
@@ -95,6 +127,10 @@ def test_selection_registers_consistent():
     assert selection_reg[1] == cirq_ft.SelectionRegister('m', 4, 12)
     assert selection_reg[:1] == cirq_ft.SelectionRegisters([cirq_ft.SelectionRegister('n', 3, 5)])
 
+    # One-shot iterables are consumed only once.
+    selection_reg = cirq_ft.SelectionRegisters(r for r in selection_reg)
+    assert selection_reg.iteration_lengths == (5, 12)
+
 
 def test_registers_getitem_raises():
     g = cirq_ft.Registers.build(a=4, b=3, c=2)